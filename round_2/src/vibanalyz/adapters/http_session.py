@@ -0,0 +1,34 @@
+"""Shared aiohttp session factory for async registry clients."""
+
+import aiohttp
+
+# aiohttp's connector defaults to 100 connections with no per-host cap;
+# set both explicitly so one registry can't monopolize the pool.
+CONNECTION_LIMIT = 100
+CONNECTION_LIMIT_PER_HOST = 10
+# Keep resolved hosts and idle TLS connections around so repeat requests
+# to the same registry skip DNS lookups and handshakes.
+DNS_CACHE_TTL_SECONDS = 300
+KEEPALIVE_TIMEOUT_SECONDS = 60
+REQUEST_TIMEOUT_SECONDS = 30
+
+
+def create_http_session() -> aiohttp.ClientSession:
+    """
+    Create a ClientSession with an explicitly sized connection pool.
+    
+    The caller owns the session and must close it when done.
+    
+    Returns:
+        Configured aiohttp.ClientSession
+    """
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTION_LIMIT,
+        limit_per_host=CONNECTION_LIMIT_PER_HOST,
+        ttl_dns_cache=DNS_CACHE_TTL_SECONDS,
+        keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS,
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS),
+    )
@@ -1,8 +1,11 @@
 """Rust/Crates.io registry client adapter - real HTTP implementation."""
 
+import asyncio
 import json
 from typing import Optional
 
+import aiohttp
+import orjson
 import requests
 
 from vibanalyz.domain.models import DownloadInfo, PackageMetadata
@@ -26,11 +29,14 @@ class NetworkError(RustError):
     pass
 
 
-def fetch_package_metadata(name: str, version: Optional[str] = None) -> PackageMetadata:
+async def fetch_package_metadata_async(
+    session: aiohttp.ClientSession, name: str, version: Optional[str] = None
+) -> PackageMetadata:
     """
-    Fetch package metadata from Crates.io API.
+    Fetch package metadata from Crates.io API using a shared aiohttp session.
     
     Args:
+        session: Open aiohttp session (connection pool is reused across calls)
         name: Package name (crate name)
         version: Optional version string. If None, fetches latest version.
     
@@ -49,35 +55,33 @@ def fetch_package_metadata(name: str, version: Optional[str] = None) -> PackageM
         url = f"https://crates.io/api/v1/crates/{name}"
     
     try:
-        # Make HTTP request with timeout
-        response = requests.get(url, timeout=10)
-        
-        # Handle 404 - package or version not found
-        if response.status_code == 404:
-            if version:
-                raise PackageNotFoundError(
-                    f"Version '{version}' not found for crate '{name}'"
-                )
-            else:
-                raise PackageNotFoundError(f"Crate '{name}' not found on Crates.io")
-        
-        # Handle other HTTP errors
-        response.raise_for_status()
-        
-        # Parse JSON response
-        try:
-            data = response.json()
-        except json.JSONDecodeError as e:
-            raise RustError(f"Invalid JSON response from Crates.io: {e}")
+        async with session.get(url, headers={"Accept": "application/json"}) as response:
+            # Handle 404 - package or version not found
+            if response.status == 404:
+                if version:
+                    raise PackageNotFoundError(
+                        f"Version '{version}' not found for crate '{name}'"
+                    )
+                else:
+                    raise PackageNotFoundError(f"Crate '{name}' not found on Crates.io")
+            
+            # Handle other HTTP errors
+            response.raise_for_status()
+            
+            # Parse JSON response
+            try:
+                data = await response.json(loads=orjson.loads, content_type=None)
+            except json.JSONDecodeError as e:
+                raise RustError(f"Invalid JSON response from Crates.io: {e}")
         
         # Parse and return metadata
         return _parse_crates_response(data, name, version)
         
-    except requests.exceptions.Timeout:
+    except asyncio.TimeoutError:
         raise NetworkError("Connection to Crates.io timed out. Please check your internet connection.")
-    except requests.exceptions.ConnectionError as e:
+    except aiohttp.ClientConnectionError as e:
         raise NetworkError(f"Unable to connect to Crates.io: {e}")
-    except requests.exceptions.RequestException as e:
+    except aiohttp.ClientError as e:
         raise NetworkError(f"Network error while fetching from Crates.io: {e}")
     except (PackageNotFoundError, RustError):
         # Re-raise our custom exceptions
@@ -1,13 +1,17 @@
 """Syft CLI adapter for SBOM generation."""
 
-import json
+import asyncio
 import shutil
-import subprocess
 import tempfile
 import zipfile
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
+
+SYFT_TIMEOUT_SECONDS = 300  # 5 minute timeout
+
 
 class SyftError(Exception):
     """Base exception for Syft-related errors."""
@@ -21,13 +25,49 @@ class SyftNotFoundError(SyftError):
     pass
 
 
-def generate_sbom(file_path: str, output_format: str = "cyclonedx-json") -> dict:
+def _prepare_syft_source(path: Path) -> tuple[str, Optional[Path]]:
     """
-    Run Syft on a file or directory and return SBOM as dict.
+    Build the Syft source argument for a file or directory.
+    
+    Wheel files are extracted to a temp directory so Python catalogers can
+    operate; the caller is responsible for removing that directory.
+    
+    Args:
+        path: Existing file or directory to scan
+    
+    Returns:
+        Tuple of (syft_source, extracted_dir or None)
+    
+    Raises:
+        SyftError: If the wheel cannot be extracted or the path type is unsupported
+    """
+    # Syft supports file: and dir: prefixes
+    if path.is_file():
+        if path.suffix.lower() == ".whl":
+            extracted_dir = Path(tempfile.mkdtemp(prefix="vibanalyz_whl_"))
+            try:
+                with zipfile.ZipFile(path, "r") as zf:
+                    zf.extractall(extracted_dir)
+            except zipfile.BadZipFile as e:
+                shutil.rmtree(extracted_dir, ignore_errors=True)
+                raise SyftError(f"Failed to extract wheel: {e}") from e
+            return f"dir:{extracted_dir}", extracted_dir
+        return f"file:{path}", None
+    if path.is_dir():
+        return f"dir:{path}", None
+    raise SyftError(f"Path is neither a file nor directory: {path}")
+
+
+async def generate_sbom_async(file_path: str, output_format: str = "cyclonedx-json") -> dict:
+    """
+    Run Syft as an asyncio subprocess and return SBOM as dict.
+    
+    Syft's output is drained through the event loop's pipe transports, so
+    no thread-pool worker is held for the duration of the scan.
     
     Args:
         file_path: Path to file or directory to scan
-        output_format: Output format (default: "json")
+        output_format: Output format (default: "cyclonedx-json")
     
     Returns:
         Parsed SBOM as dictionary
@@ -47,49 +87,47 @@ def generate_sbom(file_path: str, output_format: str = "cyclonedx-json") -> dict
     if not path.exists():
         raise SyftError(f"Path does not exist: {file_path}")
     
-    # Build command: syft file:/path/to/file -o json
-    # Syft supports file: and dir: prefixes
-    syft_source: Optional[str] = None
     extracted_dir: Optional[Path] = None
 
     try:
-        if path.is_file():
-            # For wheel files, extract to a temp directory so Python catalogers can operate
-            if path.suffix.lower() == ".whl":
-                try:
-                    extracted_dir = Path(tempfile.mkdtemp(prefix="vibanalyz_whl_"))
-                    with zipfile.ZipFile(path, "r") as zf:
-                        zf.extractall(extracted_dir)
-                except zipfile.BadZipFile as e:
-                    raise SyftError(f"Failed to extract wheel: {e}") from e
-                syft_source = f"dir:{extracted_dir}"
-            else:
-                syft_source = f"file:{file_path}"
-        elif path.is_dir():
-            syft_source = f"dir:{file_path}"
-        else:
-            raise SyftError(f"Path is neither a file nor directory: {file_path}")
-    
+        # Wheel extraction is blocking file I/O, so keep it off the loop
+        syft_source, extracted_dir = await asyncio.to_thread(_prepare_syft_source, path)
+        
         # Run Syft command
-        result = subprocess.run(
-            [syft_path, syft_source, "-o", output_format],
-            capture_output=True,
-            text=True,
-            timeout=300,  # 5 minute timeout
-            check=True,
+        proc = await asyncio.create_subprocess_exec(
+            syft_path, syft_source, "-o", output_format,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(), timeout=SYFT_TIMEOUT_SECONDS
+            )
+        except BaseException as e:
+            # Timed out or cancelled: don't leave Syft running
+            if proc.returncode is None:
+                proc.kill()
+                await proc.wait()
+            if isinstance(e, asyncio.TimeoutError):
+                raise SyftError("Syft command timed out after 5 minutes")
+            raise
+        
+        if proc.returncode != 0:
+            error_msg = (
+                stderr.decode(errors="replace")
+                or stdout.decode(errors="replace")
+                or "Unknown error"
+            )
+            raise SyftError(f"Syft command failed: {error_msg}")
         
         # Parse JSON output
         try:
-            return json.loads(result.stdout)
-        except json.JSONDecodeError as e:
+            return orjson.loads(stdout)
+        except orjson.JSONDecodeError as e:
             raise SyftError(f"Failed to parse Syft JSON output: {e}")
     
-    except subprocess.TimeoutExpired:
-        raise SyftError("Syft command timed out after 5 minutes")
-    except subprocess.CalledProcessError as e:
-        error_msg = e.stderr or e.stdout or "Unknown error"
-        raise SyftError(f"Syft command failed: {error_msg}")
+    except SyftError:
+        raise
     except FileNotFoundError:
         raise SyftNotFoundError(
             "Syft CLI not found. Install from https://github.com/anchore/syft"
@@ -99,4 +137,4 @@ def generate_sbom(file_path: str, output_format: str = "cyclonedx-json") -> dict
     finally:
         # Clean up extracted wheel directory if used
         if extracted_dir and extracted_dir.exists():
-            shutil.rmtree(extracted_dir, ignore_errors=True)
+            await asyncio.to_thread(shutil.rmtree, extracted_dir, True)
@@ -1,6 +1,7 @@
 """Analyzer plugin system."""
 
-from typing import List
+from functools import cache
+from typing import List, Tuple
 
 from vibanalyz.domain.protocols import Analyzer
 
@@ -10,13 +11,15 @@ _ANALYZERS: List[Analyzer] = []
 def register(analyzer: Analyzer) -> None:
     """Register an analyzer."""
     _ANALYZERS.append(analyzer)
+    # Registry changed; drop the cached snapshot
+    all_analyzers.cache_clear()
 
 
-def all_analyzers() -> List[Analyzer]:
-    """Get all registered analyzers."""
-    return list(_ANALYZERS)
+@cache
+def all_analyzers() -> Tuple[Analyzer, ...]:
+    """Get all registered analyzers (an immutable snapshot, cached until the next register())."""
+    return tuple(_ANALYZERS)
 
 
 # Import analyzers to trigger their registration
 from vibanalyz.analyzers import metadata  # noqa: E402, F401
-
@@ -16,10 +16,10 @@ class CopyLogAction:
     def execute(self) -> None:
         """Copy log text to clipboard and provide feedback."""
         self.log_display.set_mode("action")
-        text = self.log_display.get_text()
-        if text:
+        # Check emptiness first so we only build the full log text when needed
+        if not self.log_display.is_empty():
             try:
-                self.app.copy_to_clipboard(text)
+                self.app.copy_to_clipboard(self.log_display.get_text())
                 self.log_display.write("[log] Copied log to clipboard.")
             except Exception as e:
                 self.log_display.write(f"[log] Failed to copy log: {e}")
@@ -40,6 +40,14 @@ class LogDisplay:
         # Note: We can't await here since this is a sync method
         # The pipeline will yield control after log writes
     
+    def write_lines(self, messages: list[str]) -> None:
+        """Write several messages with the current style in one batch."""
+        style = self._style_for_mode()
+        write = self.widget.write
+        for message in messages:
+            write(Text(message, style=style))
+        self._log_buffer.extend(messages)
+    
     def _write_yellow(self, message: str) -> None:
         """Write a message in yellow (for headers)."""
         styled = Text(message, style="bright_yellow")
@@ -54,6 +62,13 @@ class LogDisplay:
         self.write(message)
         self.set_mode(previous_mode)
     
+    def write_error_lines(self, messages: list[str]) -> None:
+        """Write several error messages in red in one batch, then restore previous mode."""
+        previous_mode = self._mode
+        self.set_mode("error")
+        self.write_lines(messages)
+        self.set_mode(previous_mode)
+    
     async def write_async(self, message: str) -> None:
         """Write a message to the log and yield control to event loop."""
         self.write(message)
@@ -66,6 +81,10 @@ class LogDisplay:
         # Also clear our buffer
         self._log_buffer.clear()
 
+    def is_empty(self) -> bool:
+        """Return True if the log holds no non-blank text, without joining the buffer."""
+        return all(not line or line.isspace() for line in self._log_buffer)
+
     def get_text(self) -> str:
         """Return the entire log contents as plain text."""
         # Use our internal buffer which tracks all messages
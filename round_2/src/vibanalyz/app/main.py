@@ -1,5 +1,7 @@
 """Main Textual TUI application."""
 
+import asyncio
+
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Button, Footer, Header, Input, Label, RichLog
@@ -13,6 +15,7 @@ from vibanalyz.app.components.input_section import InputSection
 from vibanalyz.app.components.log_display import LogDisplay
 from vibanalyz.app.state import AppState
 from vibanalyz.domain.models import Context
+from vibanalyz.services.executors import configure_default_executor, get_pdf_executor
 
 
 class AuditApp(App):
@@ -121,6 +124,9 @@ class AuditApp(App):
         """Called when app is mounted."""
         # Set theme to flexoki
         self.theme = "flexoki"
+
+        # Size the default thread pool for the pipeline's blocking I/O
+        configure_default_executor(asyncio.get_running_loop())
         
         # Initialize components
         self.components["log"] = LogDisplay(self.query_one("#results-log", RichLog))
@@ -216,6 +222,7 @@ class AuditApp(App):
             requested_version=version,
             repo_source=repo_source,
             log_display=self.components["log"],
+            pdf_pool=get_pdf_executor(),
         )
 
         try:
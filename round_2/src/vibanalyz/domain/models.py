@@ -1,9 +1,13 @@
 """Domain models for package auditing."""
 
+from concurrent.futures import Executor
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
+    import aiohttp
+
     from vibanalyz.app.components.log_display import LogDisplay
 
 
@@ -47,6 +51,7 @@ class Sbom:
 
     raw: Optional[dict] = None
     file_path: Optional[str] = None
+    analysis: Optional[dict] = None  # Cached analyze_sbom_structure() result
 
 
 @dataclass
@@ -56,7 +61,7 @@ class VulnReport:
     raw: Optional[dict] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Finding:
     """A security finding from an analyzer."""
 
@@ -79,8 +84,10 @@ class Context:
     vulns: Optional[VulnReport] = None
     findings: list[Finding] = field(default_factory=list)
     log_display: Optional["LogDisplay"] = None
-    report_path: Optional[str] = None
+    report_path: Optional[Path] = None
     report_data: Optional[dict] = None
+    pdf_pool: Optional[Executor] = None
+    http_session: Optional["aiohttp.ClientSession"] = None
 
 
 @dataclass
@@ -89,5 +96,5 @@ class AuditResult:
 
     ctx: Context
     score: int
-    pdf_path: Optional[str] = None
+    pdf_path: Optional[Path] = None
 
@@ -5,7 +5,16 @@ from collections import defaultdict
 from vibanalyz.domain.models import AuditResult
 
 
-def _map_grype_severity(grype_severity: str) -> str:
+# Grype severities we keep as-is; Negligible, Unknown, or any other value maps to "info"
+_GRYPE_SEVERITY_MAP: dict[str, str] = {
+    "critical": "critical",
+    "high": "high",
+    "medium": "medium",
+    "low": "low",
+}
+
+
+def map_grype_severity(grype_severity: str) -> str:
     """
     Map Grype severity to our severity levels.
     
@@ -15,18 +24,7 @@ def _map_grype_severity(grype_severity: str) -> str:
     Returns:
         Our severity level: "critical", "high", "medium", "low", or "info"
     """
-    severity_lower = grype_severity.lower() if grype_severity else "unknown"
-    
-    if severity_lower == "critical":
-        return "critical"
-    elif severity_lower == "high":
-        return "high"
-    elif severity_lower == "medium":
-        return "medium"
-    elif severity_lower == "low":
-        return "low"
-    else:
-        return "info"
+    return _GRYPE_SEVERITY_MAP.get(grype_severity.lower() if grype_severity else "", "info")
 
 
 def compute_risk_score(result: AuditResult) -> int:
@@ -59,7 +57,7 @@ def compute_risk_score(result: AuditResult) -> int:
             if key not in seen_vulns:
                 seen_vulns.add(key)
                 grype_severity = vulnerability.get("severity", "Unknown")
-                severity = _map_grype_severity(grype_severity)
+                severity = map_grype_severity(grype_severity)
                 severity_counts[severity] += 1
         
         # Apply weights: critical=10, high=5, medium=2, low=1, info=0
@@ -1,6 +1,7 @@
 """Shared utilities for resolving the artifacts output directory."""
 
 import os
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -9,11 +10,14 @@ HOST_HINT_ENV = "ARTIFACTS_HOST_PATH"
 ARTIFACTS_DIR_ENV = "ARTIFACTS_DIR"
 
 
+@lru_cache(maxsize=1)
 def get_artifacts_dir() -> Path:
     """
     Resolve the artifacts directory, ensuring it exists.
 
     Uses ARTIFACTS_DIR if set, otherwise defaults to /artifacts.
+    The result is resolved once per process; the environment is not
+    expected to change while the app is running.
     """
     target = os.getenv(ARTIFACTS_DIR_ENV, DEFAULT_ARTIFACTS_DIR)
     path = Path(target).expanduser()
@@ -21,6 +25,7 @@ def get_artifacts_dir() -> Path:
     return path.resolve()
 
 
+@lru_cache(maxsize=4)
 def get_host_hint(artifacts_dir: Path) -> str | None:
     """
     Return a host-friendly hint for where artifacts should appear.
@@ -0,0 +1,62 @@
+"""Shared thread pools for offloading blocking pipeline work."""
+
+import asyncio
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+
+THREAD_POOL_SIZE_ENV = "VIBANALYZ_THREAD_POOL_SIZE"
+DEFAULT_THREAD_POOL_SIZE = 32
+PDF_POOL_SIZE = 2
+
+logger = logging.getLogger(__name__)
+
+_pdf_executor: ThreadPoolExecutor | None = None
+
+
+def _thread_pool_size() -> int:
+    """Read the default pool size from the environment, falling back if invalid."""
+    value = os.getenv(THREAD_POOL_SIZE_ENV)
+    if not value:
+        return DEFAULT_THREAD_POOL_SIZE
+    try:
+        size = int(value)
+    except ValueError:
+        size = 0
+    if size < 1:
+        logger.warning(
+            "Ignoring invalid %s=%r; using %d threads",
+            THREAD_POOL_SIZE_ENV,
+            value,
+            DEFAULT_THREAD_POOL_SIZE,
+        )
+        return DEFAULT_THREAD_POOL_SIZE
+    return size
+
+
+def configure_default_executor(loop: asyncio.AbstractEventLoop) -> ThreadPoolExecutor:
+    """
+    Install a dedicated default executor on the event loop.
+
+    The stock default pool is sized min(32, cpu_count + 4), which is too
+    small once network fetches, subprocess waits and file writes overlap.
+    The size can be overridden with VIBANALYZ_THREAD_POOL_SIZE; values that
+    are not positive integers are ignored.
+    """
+    executor = ThreadPoolExecutor(max_workers=_thread_pool_size(), thread_name_prefix="vibanalyz")
+    loop.set_default_executor(executor)
+    return executor
+
+
+def get_pdf_executor() -> ThreadPoolExecutor:
+    """
+    Return the process-wide executor reserved for PDF builds.
+
+    Keeping long WeasyPrint renders on their own small pool prevents them
+    from occupying default-executor threads needed by network fetches.
+    """
+    global _pdf_executor
+    if _pdf_executor is None:
+        _pdf_executor = ThreadPoolExecutor(max_workers=PDF_POOL_SIZE, thread_name_prefix="pdf")
+    return _pdf_executor
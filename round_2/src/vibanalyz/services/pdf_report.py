@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import os
+from functools import lru_cache
 from pathlib import Path
 
 from jinja2 import Environment, FileSystemLoader, TemplateError
@@ -69,6 +70,21 @@ def get_template_path() -> Path:
     raise FileNotFoundError("Bundled template vibanalyz_audit_template.xhtml not found.")
 
 
+@lru_cache(maxsize=8)
+def _get_template_environment(template_dir: Path) -> Environment:
+    """
+    Return a Jinja2 environment for a template directory, reused across reports.
+
+    Keeping the environment alive keeps its compiled-template cache warm, so
+    only the first report pays for parsing and compiling the template; later
+    renders just check the file's mtime.
+    """
+    return Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=True,
+    )
+
+
 def render_html_template(template_path: str | Path, variables: dict) -> str:
     """Render the XHTML template with the provided variables using Jinja2."""
     template_path = Path(template_path)
@@ -76,10 +92,7 @@ def render_html_template(template_path: str | Path, variables: dict) -> str:
         raise FileNotFoundError(f"Template file not found: {template_path}")
 
     try:
-        env = Environment(
-            loader=FileSystemLoader(template_path.parent),
-            autoescape=True,
-        )
+        env = _get_template_environment(template_path.parent)
         template = env.get_template(template_path.name)
         return template.render(**variables)
     except TemplateError as exc:
@@ -3,6 +3,7 @@
 import asyncio
 import time
 
+from vibanalyz.adapters.http_session import create_http_session
 from vibanalyz.domain.exceptions import PipelineFatalError
 from vibanalyz.domain.models import AuditResult, Context, Finding
 from vibanalyz.domain.scoring import compute_risk_score
@@ -171,6 +172,34 @@ async def run_pipeline(ctx: Context) -> AuditResult:
         )
         raise ValueError(error_msg)
     
+    # Share one HTTP session (and its connection pool) across the tasks that
+    # declare they need it; chains without such a task never open one
+    owns_session = ctx.http_session is None and any(
+        getattr(task, "uses_http_session", False) for task in tasks
+    )
+    if owns_session:
+        ctx.http_session = create_http_session()
+    session = ctx.http_session
+
+    try:
+        return await _execute_tasks(ctx, tasks)
+    finally:
+        if owns_session:
+            await session.close()
+            ctx.http_session = None
+
+
+async def _execute_tasks(ctx: Context, tasks: list) -> AuditResult:
+    """
+    Execute resolved tasks in order and build the audit result.
+    
+    Args:
+        ctx: Context shared by all tasks
+        tasks: Tasks resolved from the registry, in chain order
+    
+    Returns:
+        AuditResult with score and PDF path
+    """
     # Execute all tasks in sequence with timing
     # Each task is timed individually and displays its completion time
     for index, task in enumerate(tasks):
@@ -0,0 +1,173 @@
+"""Shared CycloneDX SBOM structure analysis."""
+
+import sys
+from collections import Counter
+from typing import Optional
+
+from vibanalyz.domain.models import Context
+
+
+def analyze_sbom_structure(sbom_data: dict, ctx: Optional[Context] = None) -> dict:
+    """
+    Analyze SBOM structure and return summary metrics using CycloneDX data.
+    
+    Args:
+        sbom_data: CycloneDX SBOM dictionary
+        ctx: Optional context for fallback to package metadata
+    
+    Returns:
+        Dictionary with component and dependency metrics
+    """
+    components = sbom_data.get("components", []) or []
+    dependencies = sbom_data.get("dependencies", []) or []
+    # bom-refs (often long PURLs) recur across every graph set below;
+    # interning them shares one string object and lets lookups compare
+    # by identity first
+    intern = sys.intern
+
+    # Single pass over components: types, licenses, and the
+    # library/application refs used as roots when dependencies are missing.
+    # Types are tallied afterwards by Counter, which counts in C.
+    comp_types = []
+    comp_types_append = comp_types.append
+    licenses = set()
+    licenses_add = licenses.add
+    package_refs = []
+    for comp in components:
+        comp_type = comp.get("type", "unknown")
+        comp_types_append(comp_type)
+        bom_ref = comp.get("bom-ref")
+        if bom_ref and comp_type.lower() in ("library", "application", "framework"):
+            package_refs.append(intern(bom_ref))
+        for lic in comp.get("licenses") or ():
+            # Parsed JSON only yields exact dict/str, so an identity check
+            # on the type is enough
+            lic_type = type(lic)
+            if lic_type is dict:
+                lic_obj = lic.get("license") or {}
+                lic_id = lic_obj.get("id") or lic_obj.get("name")
+                if lic_id:
+                    licenses_add(lic_id)
+            elif lic_type is str:
+                licenses_add(lic)
+
+    component_types = Counter(comp_types)
+
+    # Build dependency graph from CycloneDX dependencies array
+    # deps_map: parent_ref -> list(child_refs)
+    deps_map: dict[str, list[str]] = {}
+    children = set()
+    # roots = refs that are never a child, tracked as the graph is read
+    roots = set()
+    for dep in dependencies:
+        ref = dep.get("ref")
+        if not ref:
+            continue
+        ref = intern(ref)
+        if ref not in children:
+            roots.add(ref)
+        child_refs = dep.get("dependsOn")
+        if child_refs:
+            child_refs = [intern(child) for child in child_refs]
+            deps_map.setdefault(ref, []).extend(child_refs)
+            children.update(child_refs)
+            roots.difference_update(child_refs)
+    
+    # Initialize metadata fallback variables (used later regardless of dependencies)
+    use_metadata_fallback = False
+    declared_deps_count = 0
+    
+    # FIX: When dependencies section is missing/empty, identify root components
+    # as library/application type components (exclude file types)
+    if not dependencies and components:
+        # Library/application components (collected above) that aren't children
+        for bom_ref in package_refs:
+            if bom_ref not in children:
+                roots.add(bom_ref)
+        
+        # Fallback: Use package metadata requires_dist when dependency graph is empty
+        if ctx and ctx.package and ctx.package.requires_dist:
+            # Count declared dependencies (filter out empty/None entries)
+            declared_deps = [d for d in ctx.package.requires_dist if d]
+            declared_deps_count = len(declared_deps)
+            if declared_deps_count > 0:
+                # Use metadata fallback when we have declared deps but no graph
+                use_metadata_fallback = True
+
+    max_depth = 0
+    direct_deps_count = 0
+    transitive_deps_count = 0
+    
+    # If using metadata fallback, populate metrics from declared dependencies
+    if use_metadata_fallback:
+        # Direct dependencies = count of declared dependencies
+        # We can't know transitive without resolution, so set to 0
+        # Depth = 1 if there are any declared dependencies (they're direct, but we don't know their depth)
+        max_depth = 1 if declared_deps_count > 0 else 0
+        direct_deps_count = declared_deps_count
+    elif roots:
+        # Use CycloneDX dependency graph, walked level by level from each
+        # root on its own: depth is the deepest level any single root reaches
+        # (root = 1, direct dependencies = 2), and a component is transitive
+        # if it sits below the first level of some root, even when it is
+        # also a direct dependency of another root.
+        direct_deps = set()
+        transitive_deps = set()
+        for root in roots:
+            direct = deps_map.get(root)
+            if not direct:
+                continue
+            direct_deps.update(direct)
+            seen = {root, *direct}
+            frontier = direct
+            depth = 2
+            while True:
+                next_frontier = []
+                for node in frontier:
+                    for child in deps_map.get(node, ()):
+                        if child not in seen:
+                            seen.add(child)
+                            next_frontier.append(child)
+                if not next_frontier:
+                    break
+                transitive_deps.update(next_frontier)
+                frontier = next_frontier
+                depth += 1
+            if depth > max_depth:
+                max_depth = depth
+        direct_deps_count = len(direct_deps)
+        transitive_deps_count = len(transitive_deps)
+
+    total_components = len(components)
+
+    return {
+        "total_components": total_components,
+        "max_depth": max_depth,
+        "direct_dependencies": direct_deps_count,
+        "transitive_dependencies": transitive_deps_count,
+        "root_components": len(roots),
+        "component_types": dict(component_types),
+        "unique_licenses": len(licenses),
+        "relationship_types": {"cyclonedx_dependencies": len(dependencies)},
+    }
+
+
+def get_sbom_analysis(ctx: Context) -> Optional[dict]:
+    """
+    Return the structure analysis for ``ctx.sbom``, computing it at most once.
+    
+    The result is stored on ``ctx.sbom.analysis`` so later tasks reading the
+    same SBOM reuse it instead of re-walking the dependency graph.
+    
+    Args:
+        ctx: Pipeline context holding the SBOM
+    
+    Returns:
+        Analysis dictionary, or None if there is no SBOM data
+    """
+    sbom = ctx.sbom
+    if sbom is None or sbom.raw is None:
+        return None
+    if sbom.analysis is None:
+        sbom.analysis = analyze_sbom_structure(sbom.raw, ctx)
+    return sbom.analysis
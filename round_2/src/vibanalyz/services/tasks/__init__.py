@@ -8,7 +8,14 @@ _TASKS: Dict[str, Task] = {}
 
 
 def register(task: Task) -> None:
-    """Register a task by name."""
+    """
+    Register a task by name.
+    
+    Raises:
+        ValueError: If a task with the same name is already registered
+    """
+    if task.name in _TASKS:
+        raise ValueError(f"Task already registered: {task.name}")
     _TASKS[task.name] = task
 
 
@@ -59,10 +59,9 @@ class DownloadNpm:
                 ctx.log_display.write(f"[{self.name}] Resolving download URL from NPM...")
                 await asyncio.sleep(0)
             
-            # Run blocking network call in executor
-            loop = asyncio.get_event_loop()
-            download_info = await loop.run_in_executor(
-                None, get_download_info, ctx.package.name, version
+            # Run blocking network call in a worker thread
+            download_info = await asyncio.to_thread(
+                get_download_info, ctx.package.name, version
             )
             ctx.download_info = download_info
 
@@ -86,7 +85,7 @@ class DownloadNpm:
                                 f.write(chunk)
                 return tarball_path
 
-            await loop.run_in_executor(None, _download_file)
+            await asyncio.to_thread(_download_file)
 
             # Extract tarball (NPM tarballs contain a package/ subdirectory)
             if ctx.log_display:
@@ -105,7 +104,7 @@ class DownloadNpm:
                     package_dir = extracted_dir
                 return package_dir
 
-            package_dir = await loop.run_in_executor(None, _extract_tarball)
+            package_dir = await asyncio.to_thread(_extract_tarball)
 
             # Install NPM dependencies so Syft can detect them
             # Syft's Node.js cataloger requires node_modules to detect dependencies
@@ -138,7 +137,7 @@ class DownloadNpm:
                 return True  # True means success
 
             try:
-                install_result = await loop.run_in_executor(None, _install_dependencies)
+                install_result = await asyncio.to_thread(_install_dependencies)
                 if ctx.log_display:
                     if install_result is False:
                         # No package.json, skip installation
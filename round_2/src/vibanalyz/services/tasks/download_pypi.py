@@ -57,10 +57,9 @@ class DownloadPyPi:
                 ctx.log_display.write(f"[{self.name}] Resolving download URL from PyPI...")
                 await asyncio.sleep(0)
             
-            # Run blocking network call in executor
-            loop = asyncio.get_event_loop()
-            download_info = await loop.run_in_executor(
-                None, get_download_info, ctx.package.name, version
+            # Run blocking network call in a worker thread
+            download_info = await asyncio.to_thread(
+                get_download_info, ctx.package.name, version
             )
             ctx.download_info = download_info
 
@@ -84,7 +83,7 @@ class DownloadPyPi:
                                 f.write(chunk)
                 return target_path
 
-            await loop.run_in_executor(None, _download_file)
+            await asyncio.to_thread(_download_file)
 
             # Update context with local path
             ctx.download_info.local_path = str(target_path)
@@ -60,10 +60,9 @@ class DownloadRust:
                 ctx.log_display.write(f"[{self.name}] Resolving download URL from Crates.io...")
                 await asyncio.sleep(0)
             
-            # Run blocking network call in executor
-            loop = asyncio.get_event_loop()
-            download_info = await loop.run_in_executor(
-                None, get_download_info, ctx.package.name, version
+            # Run blocking network call in a worker thread
+            download_info = await asyncio.to_thread(
+                get_download_info, ctx.package.name, version
             )
             ctx.download_info = download_info
 
@@ -87,7 +86,7 @@ class DownloadRust:
                                 f.write(chunk)
                 return crate_path
 
-            await loop.run_in_executor(None, _download_file)
+            await asyncio.to_thread(_download_file)
 
             # Extract crate (Rust crates are gzipped tarballs)
             if ctx.log_display:
@@ -109,7 +108,7 @@ class DownloadRust:
                     crate_dir = extracted_dir
                 return crate_dir
 
-            crate_dir = await loop.run_in_executor(None, _extract_crate)
+            crate_dir = await asyncio.to_thread(_extract_crate)
 
             # Check Cargo.toml for diagnostic purposes
             cargo_toml = crate_dir / "Cargo.toml"
@@ -186,7 +185,7 @@ class DownloadRust:
             cargo_lock_path = None
             lockfile_error = None
             try:
-                cargo_lock_path = await loop.run_in_executor(None, _generate_lockfile)
+                cargo_lock_path = await asyncio.to_thread(_generate_lockfile)
                 if cargo_lock_path and ctx.log_display:
                     ctx.log_display.write(f"[{self.name}] Cargo.lock generated successfully")
                     await asyncio.sleep(0)
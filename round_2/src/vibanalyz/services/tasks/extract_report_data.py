@@ -1,136 +1,15 @@
 """Task to extract report data from context and structure it for PDF generation."""
 
 import asyncio
-from collections import defaultdict, deque
+from collections import defaultdict
 
 from vibanalyz.domain.models import Context, Finding
 from vibanalyz.domain.protocols import Task
+from vibanalyz.domain.scoring import map_grype_severity
+from vibanalyz.services.sbom_analysis import get_sbom_analysis
 from vibanalyz.services.tasks import register
 
 
-def _map_grype_severity(grype_severity: str) -> str:
-    """Map Grype severity to our severity levels."""
-    severity_lower = grype_severity.lower() if grype_severity else "unknown"
-    
-    if severity_lower == "critical":
-        return "critical"
-    elif severity_lower == "high":
-        return "high"
-    elif severity_lower == "medium":
-        return "medium"
-    elif severity_lower == "low":
-        return "low"
-    else:
-        return "info"
-
-
-def _analyze_sbom_structure(sbom_data: dict, ctx: Context = None) -> dict:
-    """
-    Analyze SBOM structure and return summary metrics using CycloneDX data.
-    
-    Args:
-        sbom_data: CycloneDX SBOM dictionary
-        ctx: Optional context for fallback to package metadata
-    
-    Returns:
-        Dictionary with component and dependency metrics
-    """
-    components = sbom_data.get("components", []) or []
-    dependencies = sbom_data.get("dependencies", []) or []
-
-    # Build dependency graph from CycloneDX dependencies array
-    deps_map = defaultdict(list)
-    all_refs = set()
-    children = set()
-    for dep in dependencies:
-        ref = dep.get("ref")
-        if not ref:
-            continue
-        all_refs.add(ref)
-        for child in dep.get("dependsOn", []) or []:
-            deps_map[ref].append(child)
-            children.add(child)
-            all_refs.add(child)
-
-    # roots = refs that are never a child
-    roots = all_refs - children if all_refs else set()
-    
-    # Initialize metadata fallback variables
-    use_metadata_fallback = False
-    declared_deps_count = 0
-    
-    # When dependencies section is missing/empty, identify root components
-    if not dependencies and components:
-        # Find library/application components that aren't children
-        for comp in components:
-            bom_ref = comp.get("bom-ref")
-            comp_type = comp.get("type", "").lower()
-            if bom_ref and comp_type in ("library", "application", "framework"):
-                if bom_ref not in children:
-                    roots.add(bom_ref)
-                    all_refs.add(bom_ref)
-        
-        # Fallback: Use package metadata requires_dist when dependency graph is empty
-        if ctx and ctx.package and ctx.package.requires_dist:
-            declared_deps = [d for d in ctx.package.requires_dist if d]
-            declared_deps_count = len(declared_deps)
-            if declared_deps_count > 0:
-                use_metadata_fallback = True
-
-    # BFS to compute depth and collect direct/transitive sets
-    def bfs_depth(start: str) -> tuple[int, set[str], set[str]]:
-        direct = set(deps_map.get(start, []))
-        if not direct:
-            return 0, direct, set()
-        
-        seen = {start}
-        transitive = set()
-        max_depth_local = 1
-        queue = deque([(child, 2) for child in direct])
-        seen.update(direct)
-        while queue:
-            node, depth = queue.popleft()
-            max_depth_local = max(max_depth_local, depth)
-            for nxt in deps_map.get(node, []):
-                if nxt not in seen:
-                    seen.add(nxt)
-                    transitive.add(nxt)
-                    queue.append((nxt, depth + 1))
-        return max_depth_local, direct, transitive
-
-    max_depth = 0
-    direct_deps = set()
-    transitive_deps = set()
-    
-    # If using metadata fallback, populate metrics from declared dependencies
-    if use_metadata_fallback:
-        max_depth = 1 if declared_deps_count > 0 else 0
-    else:
-        # Use CycloneDX dependency graph
-        for root in roots or []:
-            depth, direct, transitive = bfs_depth(root)
-            max_depth = max(max_depth, depth)
-            direct_deps.update(direct)
-            transitive_deps.update(transitive)
-
-    total_components = len(components)
-
-    # Use metadata fallback counts if applicable
-    if use_metadata_fallback:
-        direct_deps_count = declared_deps_count
-        transitive_deps_count = 0
-    else:
-        direct_deps_count = len(direct_deps)
-        transitive_deps_count = len(transitive_deps)
-
-    return {
-        "total_components": total_components,
-        "max_depth": max_depth,
-        "direct_dependencies": direct_deps_count,
-        "transitive_dependencies": transitive_deps_count,
-    }
-
-
 def _parse_vulnerabilities(vuln_data: dict) -> dict:
     """
     Parse vulnerability data and return summary.
@@ -169,7 +48,7 @@ def _parse_vulnerabilities(vuln_data: dict) -> dict:
         artifact = match.get("artifact", {})
         
         grype_severity = vulnerability.get("severity", "Unknown")
-        severity = _map_grype_severity(grype_severity)
+        severity = map_grype_severity(grype_severity)
         severity_counts[severity] += 1
         
         # Store unique vulnerability info
@@ -268,7 +147,7 @@ class ExtractReportData:
         components_data = {}
         if ctx.sbom and ctx.sbom.raw:
             try:
-                analysis = _analyze_sbom_structure(ctx.sbom.raw, ctx)
+                analysis = get_sbom_analysis(ctx)
                 components_data["total_components"] = analysis["total_components"]
                 components_data["dependency_depth"] = analysis["max_depth"]
                 components_data["direct_dependencies"] = analysis["direct_dependencies"]
@@ -41,10 +41,9 @@ class FetchPyPi:
                 ctx.log_display.write(f"[{self.name}] Fetching package metadata...")
                 await asyncio.sleep(0)
             
-            # Run blocking network call in executor to avoid blocking event loop
-            loop = asyncio.get_event_loop()
-            ctx.package = await loop.run_in_executor(
-                None, fetch_package_metadata, ctx.package_name, ctx.requested_version
+            # Run blocking network call in a worker thread to avoid blocking event loop
+            ctx.package = await asyncio.to_thread(
+                fetch_package_metadata, ctx.package_name, ctx.requested_version
             )
             
             # Success - log and add finding
@@ -6,7 +6,7 @@ from vibanalyz.adapters.rust_client import (
     NetworkError,
     PackageNotFoundError,
     RustError,
-    fetch_package_metadata,
+    fetch_package_metadata_async,
 )
 from vibanalyz.domain.exceptions import PipelineFatalError
 from vibanalyz.domain.models import Context, Finding
@@ -19,6 +19,8 @@ class FetchRust:
     """Task to fetch package metadata from Crates.io."""
 
     name = "fetch_rust"
+    # Tells the pipeline to open a shared HTTP session for this run
+    uses_http_session = True
 
     def get_status_message(self, ctx: Context) -> str:
         """Generate status message for this task."""
@@ -27,34 +29,36 @@ class FetchRust:
     async def run(self, ctx: Context) -> Context:
         """Fetch Crates.io metadata and update context."""
         # Status is updated by pipeline before task runs
+        append_finding = ctx.findings.append
+        if ctx.http_session is None:
+            msg = "Cannot fetch Crates.io metadata: no HTTP session available"
+            if ctx.log_display:
+                ctx.log_display.write_error(f"[{self.name}] ERROR: {msg}")
+            raise PipelineFatalError(message=msg, source=self.name)
+
         # Log start of fetch operation
         if ctx.log_display:
             version_info = f"=={ctx.requested_version}" if ctx.requested_version else ""
             ctx.log_display.write(f"[{self.name}] Starting fetch for {ctx.package_name}{version_info}")
-            await asyncio.sleep(0)
             ctx.log_display.write(f"[{self.name}] Connecting to Crates.io API...")
-            await asyncio.sleep(0)
         
         try:
-            # Fetch package metadata (run blocking I/O in executor)
+            # Fetch package metadata over the pipeline's shared HTTP session
             if ctx.log_display:
                 ctx.log_display.write(f"[{self.name}] Fetching package metadata...")
                 await asyncio.sleep(0)
             
-            # Run blocking network call in executor to avoid blocking event loop
-            loop = asyncio.get_event_loop()
-            ctx.package = await loop.run_in_executor(
-                None, fetch_package_metadata, ctx.package_name, ctx.requested_version
+            ctx.package = await fetch_package_metadata_async(
+                ctx.http_session, ctx.package_name, ctx.requested_version
             )
             
             # Success - log and add finding
+            version_info = f" version {ctx.package.version}" if ctx.package.version else ""
+            fetched_info = f"Successfully fetched metadata for {ctx.package_name}{version_info}"
             if ctx.log_display:
-                version_info = f" version {ctx.package.version}" if ctx.package.version else ""
-                ctx.log_display.write(f"[{self.name}] Successfully fetched metadata for {ctx.package_name}{version_info}")
-                await asyncio.sleep(0)
+                ctx.log_display.write(f"[{self.name}] {fetched_info}")
                 if ctx.package.summary:
                     ctx.log_display.write(f"[{self.name}] Summary: {ctx.package.summary}")
-                    await asyncio.sleep(0)
                 
                 # Display Package Information section
                 ctx.log_display.set_mode("action")
@@ -62,24 +66,23 @@ class FetchRust:
                 ctx.log_display.write_section("Package Information", lines)
                 await asyncio.sleep(0)
             
-            version_info = f" version {ctx.package.version}" if ctx.package.version else ""
-            ctx.findings.append(
+            append_finding(
                 Finding(
                     source=self.name,
-                    message=f"Successfully fetched metadata for {ctx.package_name}{version_info}",
+                    message=fetched_info,
                     severity="info",
                 )
             )
         except PackageNotFoundError as e:
             # Package or version not found - fatal error
+            msg = str(e)
             if ctx.log_display:
-                ctx.log_display.write_error(f"[{self.name}] ERROR: Package or version not found: {str(e)}")
-                await asyncio.sleep(0)
+                ctx.log_display.write_error(f"[{self.name}] ERROR: Package or version not found: {msg}")
             
-            ctx.findings.append(
+            append_finding(
                 Finding(
                     source=self.name,
-                    message=str(e),
+                    message=msg,
                     severity="critical",
                 )
             )
@@ -90,27 +93,27 @@ class FetchRust:
             )
         except NetworkError as e:
             # Network connection issues
+            msg = str(e)
             if ctx.log_display:
-                ctx.log_display.write_error(f"[{self.name}] ERROR: Network connection failed: {str(e)}")
-                await asyncio.sleep(0)
+                ctx.log_display.write_error(f"[{self.name}] ERROR: Network connection failed: {msg}")
             
-            ctx.findings.append(
+            append_finding(
                 Finding(
                     source=self.name,
-                    message=str(e),
+                    message=msg,
                     severity="warning",
                 )
             )
         except RustError as e:
             # Other Crates.io errors
+            msg = str(e)
             if ctx.log_display:
-                ctx.log_display.write_error(f"[{self.name}] ERROR: Crates.io API error: {str(e)}")
-                await asyncio.sleep(0)
+                ctx.log_display.write_error(f"[{self.name}] ERROR: Crates.io API error: {msg}")
             
-            ctx.findings.append(
+            append_finding(
                 Finding(
                     source=self.name,
-                    message=f"Crates.io error: {str(e)}",
+                    message=f"Crates.io error: {msg}",
                     severity="warning",
                 )
             )
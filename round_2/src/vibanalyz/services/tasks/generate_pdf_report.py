@@ -35,25 +35,30 @@ class GeneratePdfReport:
             ctx.log_display.write(f"[{self.name}] Generating PDF from report data...")
             await asyncio.sleep(0)
 
-        artifacts_dir = Path(get_artifacts_dir())
-        filename = f"vibanalyz-{ctx.package_name}-report.pdf"
-        output_pdf = artifacts_dir / filename
+        artifacts_dir = get_artifacts_dir()
+        output_pdf = artifacts_dir / f"vibanalyz-{ctx.package_name}-report.pdf"
 
-        variables = extract_template_variables(ctx.report_data)
-        template_path = get_template_path()
+        report_data = ctx.report_data
 
-        def _generate_pdf() -> Path:
-            html_content = render_html_template(template_path, variables)
+        def _render_html() -> str:
+            variables = extract_template_variables(report_data)
+            return render_html_template(get_template_path(), variables)
+
+        def _write_pdf(html_content: str) -> Path:
             return convert_html_to_pdf(html_content, output_pdf)
 
         try:
-            loop = asyncio.get_event_loop()
-            pdf_path = await loop.run_in_executor(None, _generate_pdf)
-            ctx.report_path = str(pdf_path)
+            # Render and write as separate thread hops so the event loop can
+            # service other work (UI updates, concurrent tasks) between stages.
+            # Both run on the dedicated PDF pool (if provided) so long builds
+            # don't starve network fetches on the default executor.
+            loop = asyncio.get_running_loop()
+            html_content = await loop.run_in_executor(ctx.pdf_pool, _render_html)
+            pdf_path = await loop.run_in_executor(ctx.pdf_pool, _write_pdf, html_content)
+            ctx.report_path = pdf_path
         except Exception as e:
             if ctx.log_display:
                 ctx.log_display.write_error(f"[{self.name}] ERROR: Failed to write PDF: {e}")
-                await asyncio.sleep(0)
             raise PipelineFatalError(
                 message=f"PDF generation failed: {e}",
                 source=self.name,
@@ -61,11 +66,10 @@ class GeneratePdfReport:
 
         if ctx.log_display:
             ctx.log_display.write(f"[{self.name}] PDF saved to: {ctx.report_path}")
-            await asyncio.sleep(0)
             host_hint = get_host_hint(artifacts_dir)
             if host_hint:
                 ctx.log_display.write(f"[{self.name}] Host path hint: {host_hint}")
-                await asyncio.sleep(0)
+            await asyncio.sleep(0)
 
         ctx.findings.append(
             Finding(
@@ -1,13 +1,31 @@
 """Task to run all registered analyzers."""
 
 import asyncio
+from itertools import chain
 
 from vibanalyz.analyzers import all_analyzers
-from vibanalyz.domain.models import Context
-from vibanalyz.domain.protocols import Task
+from vibanalyz.domain.models import Context, Finding
+from vibanalyz.domain.protocols import Analyzer, Task
 from vibanalyz.services.tasks import register
 
 
+# Upper-cased severity labels for the findings log, looked up instead of
+# calling str.upper() per finding
+_SEVERITY_LABELS: dict[str, str] = {
+    "critical": "CRITICAL",
+    "high": "HIGH",
+    "medium": "MEDIUM",
+    "low": "LOW",
+    "info": "INFO",
+    "warning": "WARNING",
+}
+
+
+def _collect_findings(analyzer: Analyzer, ctx: Context) -> list[Finding]:
+    """Run an analyzer and materialize its findings (called in a worker thread)."""
+    return list(analyzer.run(ctx))
+
+
 class RunAnalyses:
     """Task to run all registered analyzers."""
 
@@ -22,32 +40,44 @@ class RunAnalyses:
         # Status is updated by pipeline before task runs
         analyzers = all_analyzers()
 
-        if ctx.log_display:
-            ctx.log_display.write(f"[{self.name}] Starting security analysis")
-            await asyncio.sleep(0)
-            ctx.log_display.write(f"[{self.name}] Found {len(analyzers)} analyzer(s) to run")
-            await asyncio.sleep(0)
-
-        for idx, analyzer in enumerate(analyzers, start=1):
-            if ctx.log_display:
-                ctx.log_display.write(f"[{self.name}] Running analyzer: {analyzer.name}")
-                await asyncio.sleep(0)
-
-            findings = analyzer.run(ctx)
-            findings_list = list(findings)  # Convert iterable to list
-            
-            if ctx.log_display:
-                ctx.log_display.write(f"[{self.name}] Analyzer '{analyzer.name}' found {len(findings_list)} finding(s)")
-                await asyncio.sleep(0)
-                for finding in findings_list:
-                    ctx.log_display.write(f"[{self.name}]   [{finding.severity.upper()}] {finding.message}")
-                    await asyncio.sleep(0)
-
-            ctx.findings.extend(findings_list)
-
-        if ctx.log_display:
-            ctx.log_display.write(f"[{self.name}] Analysis complete. Total findings: {len(ctx.findings)}")
-            await asyncio.sleep(0)
+        log = ctx.log_display
+
+        if log:
+            log.write_lines([
+                f"[{self.name}] Starting security analysis",
+                f"[{self.name}] Found {len(analyzers)} analyzer(s) to run",
+            ])
+            log.write_lines(
+                [f"[{self.name}] Running analyzer: {analyzer.name}" for analyzer in analyzers]
+            )
+
+        # Analyzers are independent, so run them concurrently in worker threads;
+        # ctx.findings is only extended, on the event loop, after all of them have
+        # finished. Awaiting the gather also yields to the UI, so the log lines
+        # above need no sleep(0).
+        results = await asyncio.gather(
+            *(asyncio.to_thread(_collect_findings, analyzer, ctx) for analyzer in analyzers)
+        )
+
+        findings = ctx.findings
+        findings.extend(chain.from_iterable(results))
+
+        if not log:
+            return ctx
+
+        labels = _SEVERITY_LABELS
+        write_lines = log.write_lines
+        for analyzer, findings_list in zip(analyzers, results):
+            # One batched write per analyzer rather than one per finding
+            lines = [f"[{self.name}] Analyzer '{analyzer.name}' found {len(findings_list)} finding(s)"]
+            lines.extend(
+                f"[{self.name}]   [{labels.get(finding.severity) or finding.severity.upper()}] {finding.message}"
+                for finding in findings_list
+            )
+            write_lines(lines)
+
+        log.write(f"[{self.name}] Analysis complete. Total findings: {len(findings)}")
+        await asyncio.sleep(0)
 
         return ctx
 
@@ -2,6 +2,9 @@
 
 import asyncio
 from collections import defaultdict
+from dataclasses import dataclass
+from itertools import groupby
+from operator import itemgetter
 from typing import Optional
 
 from vibanalyz.adapters.grype_client import (
@@ -12,32 +15,18 @@ from vibanalyz.adapters.grype_client import (
 from vibanalyz.domain.exceptions import PipelineFatalError
 from vibanalyz.domain.models import Context, Finding, VulnReport
 from vibanalyz.domain.protocols import Task
+from vibanalyz.domain.scoring import map_grype_severity
 from vibanalyz.services.tasks import register
 
 
-def _map_grype_severity(grype_severity: str) -> str:
-    """
-    Map Grype severity to our severity levels.
-    
-    Args:
-        grype_severity: Grype severity string
-    
-    Returns:
-        Our severity level: "critical", "high", "medium", "low", or "info"
-    """
-    severity_lower = grype_severity.lower() if grype_severity else "unknown"
-    
-    if severity_lower == "critical":
-        return "critical"
-    elif severity_lower == "high":
-        return "high"
-    elif severity_lower == "medium":
-        return "medium"
-    elif severity_lower == "low":
-        return "low"
-    else:
-        # Negligible, Unknown, or any other value
-        return "info"
+# Display order for severity sections (critical first)
+_SEVERITY_RANK: dict[str, int] = {
+    "critical": 0,
+    "high": 1,
+    "medium": 2,
+    "low": 3,
+    "info": 4,
+}
 
 
 def _build_sbom_lookup_maps(sbom_data: dict) -> tuple[dict[str, str], dict[tuple[str, str], str]]:
@@ -52,46 +41,54 @@ def _build_sbom_lookup_maps(sbom_data: dict) -> tuple[dict[str, str], dict[tuple
         - purl_map: maps PURL to bom-ref
         - name_version_map: maps (name, version) to bom-ref
     """
-    purl_map: dict[str, str] = {}
-    name_version_map: dict[tuple[str, str], str] = {}
-    
     components = sbom_data.get("components", []) or []
-    for comp in components:
-        bom_ref = comp.get("bom-ref")
-        if not bom_ref:
-            continue
-        
-        # Extract PURL if available
-        purl = comp.get("purl")
-        if purl:
-            purl_map[purl] = bom_ref
-        
-        # Extract name and version
-        name = comp.get("name")
-        version = comp.get("version", "")
-        if name:
-            name_version_map[(name, version)] = bom_ref
+    valid = [comp for comp in components if comp.get("bom-ref")]
+    
+    # PURL -> bom-ref
+    purl_map: dict[str, str] = {
+        comp["purl"]: comp["bom-ref"] for comp in valid if comp.get("purl")
+    }
+    
+    # (name, version) -> bom-ref
+    name_version_map: dict[tuple[str, str], str] = {
+        (comp["name"], comp.get("version", "")): comp["bom-ref"]
+        for comp in valid
+        if comp.get("name")
+    }
     
     return purl_map, name_version_map
 
 
-def _extract_fixed_version(match: dict) -> Optional[str]:
+def _extract_fixed_version(vulnerability: dict) -> Optional[str]:
     """
-    Extract fixed version from Grype match.
+    Extract fixed version from a Grype match's vulnerability entry.
     
     Args:
-        match: Grype vulnerability match dictionary
+        vulnerability: The match's "vulnerability" dictionary
     
     Returns:
         Fixed version string if available, None otherwise
     """
-    vulnerability = match.get("vulnerability", {})
-    fix = vulnerability.get("fix", {})
-    versions = fix.get("versions", [])
+    versions = (vulnerability.get("fix") or {}).get("versions") or ()
+    return versions[0] if versions else None
+
+
+def _display_description(description: Optional[str]) -> Optional[str]:
+    """
+    Prepare a vulnerability description for the detail display.
     
-    if versions and len(versions) > 0:
-        return versions[0]
-    return None
+    Args:
+        description: Raw description from the first match, if any
+    
+    Returns:
+        Description truncated to 100 characters (with "..." when cut),
+        or None if there is nothing to display
+    """
+    if not description or description == "No description":
+        return None
+    if len(description) > 100:
+        return f"{description[:100]}..."
+    return description
 
 
 def _find_sbom_component(
@@ -112,20 +109,31 @@ def _find_sbom_component(
     """
     # Try PURL match first
     purl = artifact.get("purl")
-    if purl and purl in purl_map:
-        return purl_map[purl]
+    if purl:
+        bom_ref = purl_map.get(purl)
+        if bom_ref:
+            return bom_ref
     
     # Fallback to name/version match
     name = artifact.get("name")
-    version = artifact.get("version", "")
     if name:
-        key = (name, version)
-        if key in name_version_map:
-            return name_version_map[key]
+        return name_version_map.get((name, artifact.get("version", "")))
     
     return None
 
 
+@dataclass(slots=True)
+class _VulnGroup:
+    """Details of one unique vulnerability, resolved once from its first match."""
+
+    severity: str
+    fixed_version: Optional[str]
+    bom_ref: Optional[str]
+    description: Optional[str]
+    display_description: Optional[str]
+    count: int = 1
+
+
 class ScanVulnerabilities:
     """Task to scan SBOM for vulnerabilities using Grype."""
 
@@ -156,41 +164,70 @@ class ScanVulnerabilities:
                 ctx.log_display.write_with_spinner(f"[{self.name}] Running Grype... (please be patient, this can take several minutes)", spinner_style="dots")
                 await asyncio.sleep(0)
             
-            # Run blocking subprocess call in executor
-            loop = asyncio.get_event_loop()
-            vuln_data = await loop.run_in_executor(
-                None, scan_sbom, ctx.sbom.file_path
-            )
+            # Run blocking subprocess call in a worker thread. The SBOM lookup
+            # maps used for component linking don't depend on Grype's output,
+            # so they are built in another worker thread while it runs.
+            grype_scan = asyncio.to_thread(scan_sbom, ctx.sbom.file_path)
+            purl_map: dict[str, str] = {}
+            name_version_map: dict[tuple[str, str], str] = {}
+            if ctx.sbom.raw:
+                vuln_data, (purl_map, name_version_map) = await asyncio.gather(
+                    grype_scan,
+                    asyncio.to_thread(_build_sbom_lookup_maps, ctx.sbom.raw),
+                )
+            else:
+                vuln_data = await grype_scan
             
             # Write completion message (replaces spinner)
             if ctx.log_display:
                 ctx.log_display.write(f"[{self.name}] Grype scan completed")
-                await asyncio.sleep(0)
             
             # Store raw JSON in context
             ctx.vulns = VulnReport(raw=vuln_data)
 
-            # Build SBOM lookup maps for component linking
-            purl_map: dict[str, str] = {}
-            name_version_map: dict[tuple[str, str], str] = {}
-            if ctx.sbom.raw:
-                purl_map, name_version_map = _build_sbom_lookup_maps(ctx.sbom.raw)
-
             # Process vulnerabilities: deduplicate and create findings
             matches = vuln_data.get("matches", []) or []
             
-            # Group matches by composite key (cve_id, package_name, package_version)
-            vuln_groups: dict[tuple[str, str, str], list[dict]] = defaultdict(list)
+            # Group matches by composite key (cve_id, package_name, package_version).
+            # The first match of a group supplies its details, which are resolved
+            # once here and reused by both the findings and detail display below.
+            # The same pass fills the per-severity counts and display buckets.
+            vuln_groups: dict[tuple[str, str, str], _VulnGroup] = {}
+            severity_counts: dict[str, int] = defaultdict(int)
+            vulns_by_severity: dict[str, list[tuple[tuple, _VulnGroup]]] = defaultdict(list)
             for match in matches:
-                vulnerability = match.get("vulnerability", {})
-                artifact = match.get("artifact", {})
+                # Destructure the match once; everything below reads these locals
+                vulnerability = match.get("vulnerability") or {}
+                artifact = match.get("artifact") or {}
                 
                 cve_id = vulnerability.get("id", "UNKNOWN")
                 package_name = artifact.get("name", "unknown")
                 package_version = artifact.get("version", "unknown")
                 
                 key = (cve_id, package_name, package_version)
-                vuln_groups[key].append(match)
+                group = vuln_groups.get(key)
+                if group is not None:
+                    group.count += 1
+                    continue
+                
+                # Use first match for details (all matches in group have same CVE/package)
+                severity = map_grype_severity(vulnerability.get("severity", "Unknown"))
+                description = vulnerability.get("description") or vulnerability.get("name")
+                group = _VulnGroup(
+                    severity=severity,
+                    fixed_version=_extract_fixed_version(vulnerability),
+                    bom_ref=_find_sbom_component(artifact, purl_map, name_version_map),
+                    description=description,
+                    display_description=_display_description(description),
+                )
+                vuln_groups[key] = group
+                severity_counts[severity] += 1
+                vulns_by_severity[severity].append((key, group))
+
+            # Severities actually present, in display order
+            present_severities = sorted(
+                vulns_by_severity, key=lambda sev: _SEVERITY_RANK.get(sev, len(_SEVERITY_RANK))
+            )
 
             # Create findings for unique vulnerabilities
             total_matches = len(matches)
@@ -201,34 +238,16 @@ class ScanVulnerabilities:
                     f"[{self.name}] Found {total_matches} vulnerability match(es), "
                     f"{unique_vulns} unique vulnerability(ies)"
                 )
-                await asyncio.sleep(0)
 
-            # Count vulnerabilities by severity
-            severity_counts: dict[str, int] = defaultdict(int)
-            
-            for key, match_list in vuln_groups.items():
+            append_finding = ctx.findings.append
+            for key, group in vuln_groups.items():
                 cve_id, package_name, package_version = key
-                # Use first match for details (all matches in group have same CVE/package)
-                match = match_list[0]
-                vulnerability = match.get("vulnerability", {})
-                artifact = match.get("artifact", {})
-                
-                # Map severity
-                grype_severity = vulnerability.get("severity", "Unknown")
-                severity = _map_grype_severity(grype_severity)
-                severity_counts[severity] += 1
-                
-                # Extract fixed version
-                fixed_version = _extract_fixed_version(match)
-                
-                # Find SBOM component
-                bom_ref = _find_sbom_component(artifact, purl_map, name_version_map)
-                
-                # Get description
-                description = vulnerability.get("description") or vulnerability.get("name") or "No description available"
+                fixed_version = group.fixed_version
+                bom_ref = group.bom_ref
+                description = group.description or "No description available"
                 
                 # Build message
-                component_count = len(match_list)
+                component_count = group.count
                 message_parts = [f"CVE-{cve_id}: {package_name}@{package_version}"]
                 
                 if fixed_version:
@@ -244,71 +263,51 @@ class ScanVulnerabilities:
                 message = " ".join(message_parts)
                 
                 # Create finding
-                finding = Finding(
-                    source="grype",
-                    message=message,
-                    severity=severity,
+                append_finding(
+                    Finding(
+                        source="grype",
+                        message=message,
+                        severity=group.severity,
+                    )
                 )
-                ctx.findings.append(finding)
 
-            # Display vulnerability summary
+            # Display vulnerability summary, written as one batch
             if ctx.log_display:
                 if unique_vulns > 0:
-                    ctx.log_display.write(
-                        f"[{self.name}] Total Unique Vulnerabilities: {unique_vulns}"
-                    )
-                    await asyncio.sleep(0)
+                    lines = [f"[{self.name}] Total Unique Vulnerabilities: {unique_vulns}"]
                     
                     if total_matches != unique_vulns:
-                        ctx.log_display.write(
+                        lines.append(
                             f"[{self.name}] Total Matches: {total_matches} "
                             f"({total_matches - unique_vulns} duplicate(s))"
                         )
-                        await asyncio.sleep(0)
                     
                     # Display counts by severity
-                    severity_order = ["critical", "high", "medium", "low", "info"]
-                    for sev in severity_order:
-                        count = severity_counts.get(sev, 0)
-                        if count > 0:
-                            ctx.log_display.write(
-                                f"[{self.name}] {sev.capitalize()}: {count}"
-                            )
-                            await asyncio.sleep(0)
+                    for sev in present_severities:
+                        lines.append(f"[{self.name}] {sev.capitalize()}: {severity_counts[sev]}")
+                    ctx.log_display.write_lines(lines)
                 else:
                     ctx.log_display.write(
                         f"[{self.name}] No vulnerabilities found"
                     )
-                    await asyncio.sleep(0)
+                await asyncio.sleep(0)
 
             # Display detailed vulnerability list (only if vulnerabilities found)
             if unique_vulns > 0 and ctx.log_display:
                 
-                # Group by severity for display
-                vulns_by_severity: dict[str, list[tuple[tuple, dict]]] = defaultdict(list)
-                for key, match_list in vuln_groups.items():
-                    match = match_list[0]
-                    vulnerability = match.get("vulnerability", {})
-                    grype_severity = vulnerability.get("severity", "Unknown")
-                    severity = _map_grype_severity(grype_severity)
-                    vulns_by_severity[severity].append((key, match))
-                
                 # Display by severity (critical first)
-                severity_order = ["critical", "high", "medium", "low", "info"]
-                for sev in severity_order:
-                    if sev not in vulns_by_severity:
-                        continue
-                    
+                for sev in present_severities:
+                    # (is_error, line) entries for this section, flushed below
+                    # in runs of the same style so order is preserved
+                    is_error = sev in ["critical", "high"]
+                    entries: list[tuple[bool, str]] = []
                     vulns = vulns_by_severity[sev]
-                    for key, match in vulns:
+                    for key, group in vulns:
                         cve_id, package_name, package_version = key
-                        vulnerability = match.get("vulnerability", {})
-                        artifact = match.get("artifact", {})
-                        
-                        fixed_version = _extract_fixed_version(match)
-                        bom_ref = _find_sbom_component(artifact, purl_map, name_version_map)
-                        description = vulnerability.get("description") or vulnerability.get("name") or "No description"
-                        component_count = len(vuln_groups[key])
+                        fixed_version = group.fixed_version
+                        bom_ref = group.bom_ref
+                        description = group.display_description
+                        component_count = group.count
                         
                         # Build detail line
                         detail_parts = [f"  [{sev.upper()}] CVE-{cve_id}"]
@@ -327,17 +326,22 @@ class ScanVulnerabilities:
                         
                         detail_line = " ".join(detail_parts)
                         
-                        # Use write_error for critical/high, regular write for others
-                        if sev in ["critical", "high"]:
-                            ctx.log_display.write_error(detail_line)
-                        else:
-                            ctx.log_display.write(detail_line)
-                        await asyncio.sleep(0)
+                        # Error style for critical/high, regular style for others
+                        entries.append((is_error, detail_line))
                         
                         # Add description on next line if available
-                        if description and description != "No description":
-                            ctx.log_display.write(f"    {description[:100]}{'...' if len(description) > 100 else ''}")
-                            await asyncio.sleep(0)
+                        if description:
+                            entries.append((False, f"    {description}"))
+                    
+                    for run_is_error, run in groupby(entries, key=itemgetter(0)):
+                        lines = [line for _, line in run]
+                        if run_is_error:
+                            ctx.log_display.write_error_lines(lines)
+                        else:
+                            ctx.log_display.write_lines(lines)
+                    
+                    # Yield once per severity section rather than per line
+                    await asyncio.sleep(0)
 
             # Add summary finding
             if unique_vulns > 0: